@@ -476,13 +476,21 @@ class ObjectEvents(Object):
 
     def _event_kinds(self) -> List[str]:
         event_kinds: List[str] = []
+        seen: Set[str] = set()
         # We have to iterate over the class rather than instance to allow for properties which
         # might call this method (e.g., event views), leading to infinite recursion.
-        for attr_name, attr_value in inspect.getmembers(type(self)):
-            if isinstance(attr_value, EventSource):
-                # We actually care about the bound_event, however, since it
-                # provides the most info for users of this method.
-                event_kinds.append(attr_name)
+        # Walk the MRO ourselves rather than using inspect.getmembers(), which does a getattr()
+        # for every attribute; names seen in a subclass shadow those of its bases.
+        for cls in type(self).__mro__:
+            for attr_name, attr_value in cls.__dict__.items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                if isinstance(attr_value, EventSource):
+                    # We actually care about the bound_event, however, since it
+                    # provides the most info for users of this method.
+                    event_kinds.append(attr_name)
+        event_kinds.sort()
         return event_kinds
 
     def events(self) -> Dict[str, BoundEvent]:
@@ -574,6 +582,7 @@ More details at https://juju.is/docs/sdk/debugging
 """
 
 _event_regex = r'^(|.*/)on/[a-zA-Z_]+\[\d+\]$'
+_event_re = re.compile(_event_regex)
 
 
 class Framework(Object):
@@ -1020,10 +1029,9 @@ class Framework(Object):
         never deleted. This makes a best effort to find these events and remove them from the
         database.
         """
-        event_regex = re.compile(_event_regex)
         to_remove: List[str] = []
         for handle_path in self._storage.list_snapshots():
-            if event_regex.match(handle_path):
+            if _event_re.match(handle_path):
                 notices = self._storage.notices(handle_path)
                 if next(notices, None) is None:
                     # There are no notices for this handle_path, it is valid to remove it
@@ -3292,6 +3292,8 @@ class _ModelBackend:
         self._is_leader: Optional[bool] = None
         self._leader_check_time = None
         self._hook_is_running = ''
+        # Full paths of the hook tools run so far, so PATH is only searched once per tool.
+        self._hook_tool_paths: Dict[str, str] = {}
 
     def _run(
         self,
@@ -3300,35 +3302,34 @@ class _ModelBackend:
         use_json: bool = False,
         input_stream: Optional[str] = None,
     ) -> Union[str, Any, None]:
-        kwargs = {
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE,
-            'check': True,
-            'encoding': 'utf-8',
-        }
-        if input_stream:
-            kwargs.update({'input': input_stream})
-        which_cmd = shutil.which(args[0])
+        which_cmd = self._hook_tool_paths.get(args[0])
         if which_cmd is None:
-            raise RuntimeError(f'command not found: {args[0]}')
+            which_cmd = shutil.which(args[0])
+            if which_cmd is None:
+                raise RuntimeError(f'command not found: {args[0]}')
+            self._hook_tool_paths[args[0]] = which_cmd
         args = (which_cmd,) + args[1:]
         if use_json:
             args += ('--format=json',)
-        # TODO(benhoyt): all the "type: ignore"s below kinda suck, but I've
-        #                been fighting with Pyright for half an hour now...
         try:
-            result = subprocess.run(args, **kwargs)  # type: ignore
+            result = subprocess.run(
+                args,
+                capture_output=True,
+                check=True,
+                encoding='utf-8',
+                input=input_stream or None,
+            )
         except subprocess.CalledProcessError as e:
             raise ModelError(e.stderr) from e
         if return_output:
-            if result.stdout is None:  # type: ignore
+            if result.stdout is None:
                 return ''
             else:
-                text: str = result.stdout  # type: ignore
+                text: str = result.stdout
                 if use_json:
-                    return json.loads(text)  # type: ignore
+                    return json.loads(text)
                 else:
-                    return text  # type: ignore
+                    return text
 
     @staticmethod
     def _is_relation_not_found(model_error: Exception) -> bool:
@@ -79,8 +79,6 @@ from typing import (
     Union,
 )
 
-import websocket
-
 from ops._private import timeconv, yaml
 
 # Public as these are used in the Container.add_layer signature
@@ -2901,6 +2899,9 @@ class Client:
         change_id = resp['change']
         task_id = resp['result']['task-id']
 
+        # Imported here rather than at the top, as websocket-client is only needed by exec.
+        import websocket
+
         stderr_ws: Optional[_WebSocket] = None
         try:
             control_ws = self._connect_websocket(task_id, 'control')
@@ -2983,6 +2984,8 @@ class Client:
         return process
 
     def _connect_websocket(self, task_id: str, websocket_id: str) -> _WebSocket:
+        import websocket
+
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         # Set socket timeout to a short timeout during connection phase, in
         # case the Pebble side times out (5s), so this side doesn't hang. See:
@@ -669,6 +669,35 @@ class TestFramework:
             cause = str(excinfo.value.__cause__)
         assert cause == 'EventSource(MyEvent) reused as MyEvents.foo and MyNotifier.bar'
 
+    def test_event_kinds_inherited_and_shadowed(self, request: pytest.FixtureRequest):
+        framework = create_framework(request)
+
+        class MyEvent(ops.EventBase):
+            pass
+
+        class BaseEvents(ops.ObjectEvents):
+            zed = ops.EventSource(MyEvent)
+            foo = ops.EventSource(MyEvent)
+            hidden: typing.Any = ops.EventSource(MyEvent)
+
+        class MyEvents(BaseEvents):
+            bar = ops.EventSource(MyEvent)
+            # Not an EventSource, so it hides the base class's event of the same name.
+            hidden = None
+
+        class MyNotifier(ops.Object):
+            on = MyEvents()  # type: ignore
+
+        pub = MyNotifier(framework, '1')
+        # Inherited events are included, and the result is sorted by name.
+        assert list(pub.on.events()) == ['bar', 'foo', 'zed']
+        # The same kinds that inspect.getmembers() would find.
+        assert pub.on._event_kinds() == [
+            name
+            for name, value in inspect.getmembers(MyEvents)
+            if isinstance(value, ops.EventSource)
+        ]
+
     def test_reemit_ignores_unknown_event_type(self, request: pytest.FixtureRequest):
         # The event type may have been gone for good, and nobody cares,
         # so this shouldn't be an error scenario.
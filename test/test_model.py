@@ -19,6 +19,7 @@ import json
 import os
 import pathlib
 import re
+import shutil
 import tempfile
 import typing
 import unittest
@@ -2713,6 +2714,18 @@ class TestModelBackend:
         self.backend._leader_check_time = None
         assert model.unit.is_leader()
 
+    def test_hook_tool_path_cached(self, fake_script: FakeScript):
+        fake_script.write('is-leader', 'echo true')
+        with mock.patch('shutil.which', side_effect=shutil.which) as which:
+            assert self.backend.is_leader()
+            self.backend._leader_check_time = None
+            assert self.backend.is_leader()
+        which.assert_called_once_with('is-leader')
+        assert fake_script.calls(clear=True) == [
+            ['is-leader', '--format=json'],
+            ['is-leader', '--format=json'],
+        ]
+
     def test_relation_tool_errors(self, fake_script: FakeScript, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.setattr(
             self.backend, '_juju_context', _JujuContext.from_dict({'JUJU_VERSION': '2.8.0'})
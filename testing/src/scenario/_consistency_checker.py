@@ -399,10 +399,24 @@ def check_storages_consistency(
     return Results(errors, [])
 
 
+# cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
+_SECRET_IDENTIFIER_RE = re.compile(r"secret:[0-9a-z]{20}$")
+
+
 def _is_secret_identifier(value: Union[str, int, float, bool]) -> bool:
     """Return true iff the value is in the form `secret:{secret id}`."""
-    # cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
-    return bool(re.match(r"secret:[0-9a-z]{20}$", str(value)))
+    return bool(_SECRET_IDENTIFIER_RE.match(str(value)))
+
+
+_CONFIG_CONVERTERS: Dict[str, type] = {
+    "string": str,
+    "int": int,
+    "float": float,
+    "boolean": bool,
+}
+_CONFIG_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "secret": _is_secret_identifier,
+}
 
 
 def check_config_consistency(
@@ -417,6 +431,10 @@ def check_config_consistency(
     meta_config = (charm_spec.config or {}).get("options", {})
     errors: List[str] = []
 
+    converters = _CONFIG_CONVERTERS
+    if juju_version >= (3, 4):
+        converters = {**converters, "secret": str}
+
     for key, value in state_config.items():
         if key not in meta_config:
             errors.append(
@@ -425,24 +443,11 @@ def check_config_consistency(
             )
             continue
 
-        converters = {
-            "string": str,
-            "int": int,
-            "float": float,
-            "boolean": bool,
-        }
-        if juju_version >= (3, 4):
-            converters["secret"] = str
-
-        validators = {
-            "secret": _is_secret_identifier,
-        }
-
         expected_type_name = meta_config[key].get("type", None)
         if not expected_type_name:
             errors.append(f"config.yaml invalid; option {key!r} has no 'type'.")
             continue
-        validator = validators.get(expected_type_name)
+        validator = _CONFIG_VALIDATORS.get(expected_type_name)
 
         expected_type = converters.get(expected_type_name)
         if not expected_type:
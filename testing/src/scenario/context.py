@@ -43,7 +43,6 @@ if TYPE_CHECKING:  # pragma: no cover
     from .ops_main_mock import Ops
     from .state import (
         AnyJson,
-        CharmType,
         JujuLogLine,
         RelationBase,
         State,
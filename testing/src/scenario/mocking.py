@@ -3,6 +3,7 @@
 # See LICENSE file for licensing details.
 
 import datetime
+import functools
 import io
 import shutil
 from pathlib import Path
@@ -20,11 +21,9 @@ from typing import (
     Tuple,
     Union,
     cast,
-    get_args,
 )
 
 from ops import (
-    JujuVersion,
     pebble,
     SecretInfo,
     SecretNotFoundError,
@@ -38,6 +37,7 @@ from ops.model import CloudSpec as CloudSpec_Ops
 from ops.model import Port as Port_Ops
 from ops.model import Secret as Secret_Ops  # lol
 from ops.model import (
+    _SETTABLE_STATUS_NAMES,
     _format_action_result_dict,
     _ModelBackend,
     _SettableStatusName,
@@ -64,28 +64,75 @@ from .state import (
 if TYPE_CHECKING:  # pragma: no cover
     from .context import Context
     from .state import Container as ContainerSpec
-    from .state import Exec, Secret, State, _CharmSpec, _Event
+    from .state import Exec, Port, Secret, State, _CharmSpec, _Event
 
 logger = scenario_logger.getChild("mocking")
 
+# status_set is called a lot, so check the status name with a single set lookup.
+_SETTABLE_STATUS_NAMES_SET = frozenset(_SETTABLE_STATUS_NAMES)
+
+
+def _exec_output(data: Union[str, bytes], encoding: Optional[str]) -> Union[str, bytes]:
+    """Convert mocked exec output to the type the charm will read, as Harness does."""
+    if isinstance(data, bytes):
+        return data if encoding is None else data.decode(encoding=encoding)
+    if encoding is None:
+        raise ValueError(
+            f"exec handler must return bytes if encoding is None, "
+            f"not {data.__class__.__name__}",
+        )
+    return data
+
+
+def _output_stream(data: Union[str, bytes]) -> Union[TextIO, io.BytesIO]:
+    return io.BytesIO(data) if isinstance(data, bytes) else io.StringIO(data)
+
 
 class _MockExecProcess:
+    __slots__ = (
+        "_change_id",
+        "_args",
+        "_return_code",
+        "_waited",
+        "stdin",
+        "_stdout",
+        "_stderr",
+        "_stdout_stream",
+        "_stderr_stream",
+    )
+
     def __init__(
         self,
         change_id: int,
         args: ExecArgs,
         return_code: int,
         stdin: Optional[Union[TextIO, io.BytesIO]],
-        stdout: Optional[Union[TextIO, io.BytesIO]],
-        stderr: Optional[Union[TextIO, io.BytesIO]],
+        stdout: Optional[Union[str, bytes]],
+        stderr: Optional[Union[str, bytes]],
     ):
         self._change_id = change_id
         self._args = args
         self._return_code = return_code
         self._waited = False
         self.stdin = stdin
-        self.stdout = stdout
-        self.stderr = stderr
+        # The stdout and stderr streams are only created if the charm reads from them, as
+        # wait_output() can hand back the output as-is.
+        self._stdout = stdout
+        self._stderr = stderr
+        self._stdout_stream: Optional[Union[TextIO, io.BytesIO]] = None
+        self._stderr_stream: Optional[Union[TextIO, io.BytesIO]] = None
+
+    @property
+    def stdout(self) -> Optional[Union[TextIO, io.BytesIO]]:
+        if self._stdout_stream is None and self._stdout is not None:
+            self._stdout_stream = _output_stream(self._stdout)
+        return self._stdout_stream
+
+    @property
+    def stderr(self) -> Optional[Union[TextIO, io.BytesIO]]:
+        if self._stderr_stream is None and self._stderr is not None:
+            self._stderr_stream = _output_stream(self._stderr)
+        return self._stderr_stream
 
     def __del__(self):
         if not self._waited:
@@ -105,8 +152,15 @@ class _MockExecProcess:
     def wait_output(self):
         self._close_stdin()
         self._waited = True
-        stdout = self.stdout.read() if self.stdout is not None else None
-        stderr = self.stderr.read() if self.stderr is not None else None
+        if self._stdout_stream is not None:
+            stdout = self._stdout_stream.read()
+        else:
+            # Behave as if the (not yet created) stream had been read to the end.
+            stdout, self._stdout = self._stdout, self._stdout and self._stdout[:0]
+        if self._stderr_stream is not None:
+            stderr = self._stderr_stream.read()
+        else:
+            stderr, self._stderr = self._stderr, self._stderr and self._stderr[:0]
         if self._return_code != 0:
             raise ExecError(
                 list(self._args.command),
@@ -120,9 +174,6 @@ class _MockExecProcess:
         raise NotImplementedError()
 
 
-_NOT_GIVEN = object()  # non-None default value sentinel
-
-
 # pyright: reportIncompatibleMethodOverride=false
 class _MockModelBackend(_ModelBackend):  # type: ignore
     def __init__(
@@ -153,11 +204,10 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         # fixme: the charm will get hit with a StateValidationError
         #  here, not the expected ModelError...
         port_ = _port_cls_by_protocol[protocol](port=port)  # type: ignore
-        ports = set(self._state.opened_ports)
+        # State.__post_init__ has already made this a frozenset.
+        ports = cast("frozenset[Port]", self._state.opened_ports)
         if port_ not in ports:
-            ports.add(port_)
-        if ports != self._state.opened_ports:
-            self._state._update_opened_ports(frozenset(ports))
+            self._state._update_opened_ports(ports | {port_})
 
     def close_port(
         self,
@@ -165,11 +215,10 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         port: Optional[int] = None,
     ):
         _port = _port_cls_by_protocol[protocol](port=port)  # type: ignore
-        ports = set(self._state.opened_ports)
+        # State.__post_init__ has already made this a frozenset.
+        ports = cast("frozenset[Port]", self._state.opened_ports)
         if _port in ports:
-            ports.remove(_port)
-        if ports != self._state.opened_ports:
-            self._state._update_opened_ports(frozenset(ports))
+            self._state._update_opened_ports(ports - {_port})
 
     def get_pebble(self, socket_path: str) -> "Client":
         container_name = socket_path.split("/")[
@@ -205,7 +254,8 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
     def _get_secret(self, id: Optional[str] = None, label: Optional[str] = None):
         # FIXME: what error would a charm get IRL?
         # ops 2.0 supports secrets, but juju only supports it from 3.0.2
-        if self._context.juju_version < "3.0.2":
+        version = self._juju_context.version
+        if (version.major, version.minor, version.patch) < (3, 0, 2):
             raise RuntimeError(
                 "secrets are only available in juju >= 3.0.2."
                 "Set ``Context.juju_version`` to 3.0.2+ to use them.",
@@ -217,15 +267,12 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
             # in scenario, you can create Secret(id="foo"),
             # but ops.Secret will prepend a "secret:" prefix to that ID.
             # we allow getting secret by either version.
-            secrets = [
-                s
-                for s in self._state.secrets
-                if canonicalize_id(s.id, model_uuid=self._state.model.uuid)
-                == canonicalize_id(id, model_uuid=self._state.model.uuid)
-            ]
-            if not secrets:
-                raise SecretNotFoundError(id)
-            return secrets[0]
+            model_uuid = self._state.model.uuid
+            canonical_id = canonicalize_id(id, model_uuid=model_uuid)
+            for secret in self._state.secrets:
+                if canonicalize_id(secret.id, model_uuid=model_uuid) == canonical_id:
+                    return secret
+            raise SecretNotFoundError(id)
 
         elif label:
             try:
@@ -245,7 +292,7 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         if not is_app:
             return
 
-        version = JujuVersion(self._context.juju_version)
+        version = self._juju_context.version
         if not version.has_app_data():
             raise RuntimeError(
                 f"setting application data is not supported on Juju version {version}",
@@ -266,8 +313,8 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         elif member_name == self.unit_name:
             return relation.local_unit_data
 
-        unit_id = int(member_name.split("/")[-1])
-        return relation._get_databag_for_remote(unit_id)  # noqa
+        _, _, unit_id = member_name.rpartition("/")
+        return relation._get_databag_for_remote(int(unit_id))  # noqa
 
     def is_leader(self):
         return self._state.leader
@@ -294,29 +341,13 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         )
 
     def config_get(self):
-        state_config = self._state.config.copy()  # dedup or we'll mutate the state!
-
-        # add defaults
-        charm_config = self._charm_spec.config
-        if not charm_config:
-            return state_config
-
-        for key, value in charm_config["options"].items():
-            # if it has a default, and it's not overwritten from State, use it:
-            if key not in state_config:
-                default_value = value.get("default", _NOT_GIVEN)
-                if default_value is not _NOT_GIVEN:  # accept False as default value
-                    state_config[key] = default_value
-
-        return state_config  # full config
+        # Options set in the State override the defaults. Build a new dict so that
+        # the State doesn't get mutated.
+        return {**self._charm_spec._get_config_defaults(), **self._state.config}
 
     def network_get(self, binding_name: str, relation_id: Optional[int] = None):
         # validation:
         extra_bindings = self._charm_spec.meta.get("extra-bindings", ())
-        all_endpoints = self._charm_spec.get_all_relations()
-        non_sub_relations = {
-            name for name, meta in all_endpoints if meta.get("scope") != "container"
-        }
 
         # - is binding_name a valid binding name?
         if binding_name in extra_bindings:
@@ -333,7 +364,10 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
             # implicit relation that always exists
             pass
         # - verify that the binding is a relation endpoint name, but not a subordinate one
-        elif binding_name not in non_sub_relations:
+        elif not any(
+            name == binding_name and meta.get("scope") != "container"
+            for name, meta in self._charm_spec.get_all_relations()
+        ):
             logger.error(
                 f"cannot get network binding for {binding_name}: is not a valid relation "
                 f"endpoint name nor an extra-binding.",
@@ -362,10 +396,10 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         *,
         is_app: bool = False,
     ):
-        valid_names = get_args(_SettableStatusName)
-        if status not in valid_names:
+        if status not in _SETTABLE_STATUS_NAMES_SET:
             raise ModelError(
-                f'ERROR invalid status "{status}", expected one of [{", ".join(valid_names)}]',
+                f'ERROR invalid status "{status}", '
+                f'expected one of [{", ".join(_SETTABLE_STATUS_NAMES)}]',
             )
         self._context._record_status(self._state, is_app)
         status_obj = _EntityStatus.from_status_name(status, message)
@@ -442,8 +476,9 @@ class _MockModelBackend(_ModelBackend):  # type: ignore
         # If both the id and label are provided, then update the label.
         if id is not None and label is not None:
             secret._set_label(label)
-        juju_version = self._context.juju_version
-        if not (juju_version == "3.1.7" or juju_version >= "3.3.1"):
+        version = self._juju_context.version
+        version_tuple = (version.major, version.minor, version.patch)
+        if not (version_tuple == (3, 1, 7) or version_tuple >= (3, 3, 1)):
             # In this medieval Juju chapter,
             # secret owners always used to track the latest revision.
             # ref: https://bugs.launchpad.net/juju/+bug/2037120
@@ -787,16 +822,15 @@ class _MockPebbleClient(_TestingPebbleClient):
     def get_plan(self) -> pebble.Plan:
         return self._container.plan
 
-    @property
+    @functools.cached_property
     def _container(self) -> "ContainerSpec":
-        container_name = self.socket_path.split("/")[-2]
+        # The State's containers don't change during a run, so the lookup is only
+        # done once per client.
         try:
-            return next(
-                filter(lambda x: x.name == container_name, self._state.containers),
-            )
-        except StopIteration:
+            return self._state.get_container(self._container_name)
+        except KeyError:
             raise RuntimeError(
-                f"container with name={container_name!r} not found. "
+                f"container with name={self._container_name!r} not found. "
                 f"Did you forget a Container, or is the socket path "
                 f"{self.socket_path!r} wrong?",
             )
@@ -811,7 +845,7 @@ class _MockPebbleClient(_TestingPebbleClient):
 
     # Based on a method of the same name from Harness.
     def _find_exec_handler(self, command: List[str]) -> Optional["Exec"]:
-        handlers = {exec.command_prefix: exec for exec in self._container.execs}
+        handlers = self._container._execs_by_prefix
         # Start with the full command and, each loop iteration, drop the last
         # element, until it matches one of the command prefixes in the execs.
         # This includes matching against the empty list, which will match any
@@ -861,12 +895,12 @@ class _MockPebbleClient(_TestingPebbleClient):
             proc_stdin = None
             stdin = stdin.read() if hasattr(stdin, "read") else stdin  # type: ignore
         if stdout is None:
-            proc_stdout = self._transform_exec_handler_output(handler.stdout, encoding)
+            proc_stdout = _exec_output(handler.stdout, encoding)
         else:
             proc_stdout = None
             stdout.write(handler.stdout)
         if stderr is None:
-            proc_stderr = self._transform_exec_handler_output(handler.stderr, encoding)
+            proc_stderr = _exec_output(handler.stderr, encoding)
         else:
             proc_stderr = None
             stderr.write(handler.stderr)
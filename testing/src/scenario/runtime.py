@@ -23,7 +23,6 @@ from typing import (
     Union,
 )
 
-import yaml
 from ops import (
     CollectStatusEvent,
     pebble,
@@ -37,6 +36,7 @@ from ops import (
 from ops.jujucontext import _JujuContext
 from ops.storage import NoSnapshotError, SQLiteStorage
 from ops.framework import _event_regex
+from ops._private import yaml
 from ops._private.harness import ActionFailed
 
 from .errors import NoObserverError, UncaughtCharmError
@@ -346,9 +346,10 @@ class Runtime:
             # Still, log it for clarity.
             if any_metadata_files_present_in_charm_virtual_root:
                 logger.debug(
-                    f"metadata files found in custom charm_root {charm_virtual_root}. "
-                    f"The spec was autoloaded so the contents should be identical. "
-                    f"Proceeding...",
+                    "metadata files found in custom charm_root %s. "
+                    "The spec was autoloaded so the contents should be identical. "
+                    "Proceeding...",
+                    charm_virtual_root,
                 )
 
         elif (
@@ -432,7 +433,7 @@ class Runtime:
         check_consistency(state, event, self._charm_spec, self._juju_version)
 
         charm_type = self._charm_spec.charm_type
-        logger.info(f"Preparing to fire {event.name} on {charm_type.__name__}")
+        logger.info("Preparing to fire %s on %s", event.name, charm_type.__name__)
 
         # we make a copy to avoid mutating the input state
         output_state = copy.deepcopy(state)
@@ -6,8 +6,10 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 import datetime
+import functools
 import inspect
 import random
 import re
@@ -36,10 +38,10 @@ from typing import (
 from uuid import uuid4
 
 import ops
-import yaml
 from ops import pebble, CharmBase, CharmEvents, SecretRotate, StatusBase
 from ops import CloudCredential as CloudCredential_Ops
 from ops import CloudSpec as CloudSpec_Ops
+from ops._private import yaml
 
 from .errors import MetadataNotFoundError, StateValidationError
 from .logger import logger as scenario_logger
@@ -174,7 +176,14 @@ def _max_posargs(n: int):
             # The default __reduce__ doesn't understand that some arguments have
             # to be passed as keywords, so using the copy module fails.
             attrs = cast(Dict[str, Any], super().__reduce__()[2])
-            return (lambda: self.__class__(**attrs), ())
+            # Only pass on the dataclass fields: anything else in the instance dict is a
+            # cache (see, for example, State._relations_by_id) that is rebuilt on demand.
+            fields = {
+                field.name: attrs[field.name]
+                for field in dataclasses.fields(cast(Any, self))
+                if field.init and field.name in attrs
+            }
+            return (lambda: self.__class__(**fields), ())
 
     return _MaxPositionalArgs
 
@@ -397,6 +406,10 @@ class Address(_max_posargs(1)):
     def address(self, value: str):
         object.__setattr__(self, "value", value)
 
+    def _hook_tool_output_fmt(self):
+        # dumps itself to dict in the same format the hook tool would
+        return {"value": self.value, "hostname": self.hostname, "cidr": self.cidr}
+
 
 @dataclasses.dataclass(frozen=True)
 class BindAddress(_max_posargs(1)):
@@ -414,7 +427,7 @@ class BindAddress(_max_posargs(1)):
         # todo support for legacy (deprecated) `interfacename` and `macaddress` fields?
         dct = {
             "interface-name": self.interface_name,
-            "addresses": [dataclasses.asdict(addr) for addr in self.addresses],
+            "addresses": [addr._hook_tool_output_fmt() for addr in self.addresses],
         }
         if self.mac_address:
             dct["mac-address"] = self.mac_address
@@ -706,8 +719,9 @@ def _generate_new_change_id():
     global _CHANGE_IDS
     _CHANGE_IDS += 1  # type: ignore
     logger.info(
-        f"change ID unset; automatically assigning {_CHANGE_IDS}. "
-        f"If there are problems, pass one manually.",
+        "change ID unset; automatically assigning %s. "
+        "If there are problems, pass one manually.",
+        _CHANGE_IDS,
     )
     return _CHANGE_IDS
 
@@ -917,7 +931,7 @@ class Container(_max_posargs(1)):
     # }
     # when the charm runs `pebble.pull`, it will return .open() from one of those paths.
     # when the charm pushes, it will either overwrite one of those paths (careful!) or it will
-    # create a tempfile and insert its path in the mock filesystem tree
+    # write the file directly into the simulated container root
     mounts: dict[str, Mount] = dataclasses.field(default_factory=dict)
     """Provides access to the contents of the simulated container filesystem.
 
@@ -970,6 +984,11 @@ class Container(_max_posargs(1)):
             # Allow passing a regular set (or other iterable) of Execs.
             object.__setattr__(self, "execs", frozenset(self.execs))
 
+    @functools.cached_property
+    def _execs_by_prefix(self) -> dict[tuple[str, ...], Exec]:
+        # execs is a frozenset, so this can be computed once rather than on every exec call.
+        return {exec.command_prefix: exec for exec in self.execs}
+
     def _render_services(self):
         # copied over from ops.testing._TestingPebbleClient._render_services()
         services: dict[str, pebble.Service] = {}
@@ -1002,14 +1021,7 @@ class Container(_max_posargs(1)):
         """The Pebble services as rendered in the plan."""
         services = self._render_services()
         infos: dict[str, pebble.ServiceInfo] = {}
-        names = sorted(services.keys())
-        for name in names:
-            try:
-                service = services[name]
-            except KeyError:
-                # in pebble, it just returns "nothing matched" if there are 0 matches,
-                # but it ignores services it doesn't recognize
-                continue
+        for name, service in sorted(services.items()):
             status = self.service_statuses.get(name, pebble.ServiceStatus.INACTIVE)
             if service.startup == "":
                 startup = pebble.ServiceStartup.DISABLED
@@ -1481,19 +1493,34 @@ class State(_max_posargs(0)):
         # bypass frozen dataclass
         object.__setattr__(self, "secrets", new_secrets)
 
+    # The charm looks up relations, containers and networks on (almost) every hook tool
+    # and Pebble call, so we index them once. These attributes are never replaced after
+    # __post_init__, so the indexes can't go stale.
+    @functools.cached_property
+    def _containers_by_name(self) -> dict[str, Container]:
+        return {container.name: container for container in self.containers}
+
+    @functools.cached_property
+    def _networks_by_binding_name(self) -> dict[str, Network]:
+        return {network.binding_name: network for network in self.networks}
+
+    @functools.cached_property
+    def _relations_by_id(self) -> dict[int, RelationBase]:
+        return {relation.id: relation for relation in self.relations}
+
     def get_container(self, container: str, /) -> Container:
         """Get container from this State, based on its name."""
-        for state_container in self.containers:
-            if state_container.name == container:
-                return state_container
-        raise KeyError(f"container: {container} not found in the State")
+        try:
+            return self._containers_by_name[container]
+        except KeyError:
+            raise KeyError(f"container: {container} not found in the State") from None
 
     def get_network(self, binding_name: str, /) -> Network:
         """Get network from this State, based on its binding name."""
-        for network in self.networks:
-            if network.binding_name == binding_name:
-                return network
-        raise KeyError(f"network: {binding_name} not found in the State")
+        try:
+            return self._networks_by_binding_name[binding_name]
+        except KeyError:
+            raise KeyError(f"network: {binding_name} not found in the State") from None
 
     def get_secret(
         self,
@@ -1544,10 +1571,10 @@ class State(_max_posargs(0)):
 
     def get_relation(self, relation: int, /) -> RelationBase:
         """Get relation from this State, based on the relation's id."""
-        for state_relation in self.relations:
-            if state_relation.id == relation:
-                return state_relation
-        raise KeyError(f"relation: id={relation} not found in the State")
+        try:
+            return self._relations_by_id[relation]
+        except KeyError:
+            raise KeyError(f"relation: id={relation} not found in the State") from None
 
     def get_relations(self, endpoint: str) -> tuple[RelationBase, ...]:
         """Get all relations on this endpoint from the current state."""
@@ -1565,12 +1592,31 @@ class State(_max_posargs(0)):
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _load_yaml_file(path: Path, mtime_ns: int, size: int) -> Any:  # noqa: U100
+    # mtime_ns and size are only part of the cache key: an edited file gets parsed again.
+    with path.open() as f:
+        return yaml.safe_load(f)
+
+
+def _read_yaml_file(path: Path) -> Any:
+    """Parse a charm metadata file, reusing an earlier parse if the file is unchanged.
+
+    Charm tests typically create a new Context (and so autoload the charm's metadata)
+    for every test, so this saves parsing the same files over and over.
+    """
+    # The cached object is shared, so hand out a copy that callers are free to modify.
+    stat = path.stat()
+    return copy.deepcopy(_load_yaml_file(path, stat.st_mtime_ns, stat.st_size))
+
+
 def _is_valid_charmcraft_25_metadata(meta: dict[str, Any]):
     # Check whether this dict has the expected mandatory metadata fields according to the
     # charmcraft >2.5 charmcraft.yaml schema
     if (config_type := meta.get("type")) != "charm":
         logger.debug(
-            f"Not a charm: charmcraft yaml config ``.type`` is {config_type!r}.",
+            "Not a charm: charmcraft yaml config ``.type`` is %r.",
+            config_type,
         )
         return False
     if not all(field in meta for field in {"name", "summary", "description"}):
@@ -1599,14 +1645,14 @@ class _CharmSpec(Generic[CharmType]):
         # files for charm metadata.
         metadata_path = charm_root / "metadata.yaml"
         meta: dict[str, Any] = (
-            yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
+            _read_yaml_file(metadata_path) if metadata_path.exists() else {}
         )
 
         config_path = charm_root / "config.yaml"
-        config = yaml.safe_load(config_path.open()) if config_path.exists() else None
+        config = _read_yaml_file(config_path) if config_path.exists() else None
 
         actions_path = charm_root / "actions.yaml"
-        actions = yaml.safe_load(actions_path.open()) if actions_path.exists() else None
+        actions = _read_yaml_file(actions_path) if actions_path.exists() else None
         return meta, config, actions
 
     @staticmethod
@@ -1614,7 +1660,7 @@ class _CharmSpec(Generic[CharmType]):
         """Load metadata from charm projects created with Charmcraft >= 2.5."""
         metadata_path = charm_root / "charmcraft.yaml"
         meta: dict[str, Any] = (
-            yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
+            _read_yaml_file(metadata_path) if metadata_path.exists() else {}
         )
         if not _is_valid_charmcraft_25_metadata(meta):
             meta = {}
@@ -1654,6 +1700,17 @@ class _CharmSpec(Generic[CharmType]):
             is_autoloaded=True,
         )
 
+    def _get_config_defaults(self) -> dict[str, Any]:
+        """The default value of each config option that declares one."""
+        if not self.config:
+            return {}
+        return {
+            key: option["default"]
+            for key, option in self.config["options"].items()
+            # accept False and None as default values
+            if "default" in option
+        }
+
     def get_all_relations(self) -> list[tuple[str, dict[str, str]]]:
         """A list of all relation endpoints defined in the metadata."""
         return list(
@@ -1706,6 +1763,24 @@ class _EventType(str, Enum):
     custom = "custom"
 
 
+# Events whose type is determined by their full name, mapped to (suffix, type).
+_EVENT_TYPES_BY_NAME: dict[str, tuple[str, _EventType]] = {
+    **{name: ("", _EventType.builtin) for name in _BUILTIN_EVENTS},
+    **{name: (name, _EventType.framework) for name in _FRAMEWORK_EVENTS},
+    **{name: (name, _EventType.secret) for name in _SECRET_EVENTS},
+}
+# Events whose type is determined by the suffix of their name.
+_EVENT_TYPES_BY_SUFFIX: tuple[tuple[str, _EventType], ...] = (
+    *((suffix, _EventType.relation) for suffix in _RELATION_EVENTS_SUFFIX),
+    (_ACTION_EVENT_SUFFIX, _EventType.action),
+    *((suffix, _EventType.storage) for suffix in _STORAGE_EVENTS_SUFFIX),
+    (_PEBBLE_READY_EVENT_SUFFIX, _EventType.workload),
+    (_PEBBLE_CUSTOM_NOTICE_EVENT_SUFFIX, _EventType.workload),
+    (_PEBBLE_CHECK_FAILED_EVENT_SUFFIX, _EventType.workload),
+    (_PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX, _EventType.workload),
+)
+
+
 class _EventPath(str):
     if TYPE_CHECKING:  # pragma: no cover
         name: str
@@ -1735,38 +1810,18 @@ class _EventPath(str):
 
     @staticmethod
     def _get_suffix_and_type(s: str) -> tuple[str, _EventType]:
-        for suffix in _RELATION_EVENTS_SUFFIX:
-            if s.endswith(suffix):
-                return suffix, _EventType.relation
-
-        if s.endswith(_ACTION_EVENT_SUFFIX):
-            return _ACTION_EVENT_SUFFIX, _EventType.action
-
-        if s in _SECRET_EVENTS:
-            return s, _EventType.secret
+        # Secret, framework and the other builtin events are matched by their full name.
+        if (suffix_and_type := _EVENT_TYPES_BY_NAME.get(s)) is not None:
+            return suffix_and_type
 
-        if s in _FRAMEWORK_EVENTS:
-            return s, _EventType.framework
-
-        # Whether the event name indicates that this is a storage event.
-        for suffix in _STORAGE_EVENTS_SUFFIX:
+        for suffix, event_type in _EVENT_TYPES_BY_SUFFIX:
             if s.endswith(suffix):
-                return suffix, _EventType.storage
+                return suffix, event_type
 
-        # Whether the event name indicates that this is a workload event.
-        if s.endswith(_PEBBLE_READY_EVENT_SUFFIX):
-            return _PEBBLE_READY_EVENT_SUFFIX, _EventType.workload
-        if s.endswith(_PEBBLE_CUSTOM_NOTICE_EVENT_SUFFIX):
-            return _PEBBLE_CUSTOM_NOTICE_EVENT_SUFFIX, _EventType.workload
-        if s.endswith(_PEBBLE_CHECK_FAILED_EVENT_SUFFIX):
-            return _PEBBLE_CHECK_FAILED_EVENT_SUFFIX, _EventType.workload
-        if s.endswith(_PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX):
-            return _PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX, _EventType.workload
+        return "", _EventType.custom
 
-        if s in _BUILTIN_EVENTS:
-            return "", _EventType.builtin
 
-        return "", _EventType.custom
+_HANDLER_REPR_RE = re.compile(r"<function (.*) at .*>")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1889,8 +1944,7 @@ class _Event:  # type: ignore
     def deferred(self, handler: Callable[..., Any], event_id: int = 1) -> DeferredEvent:
         """Construct a DeferredEvent from this Event."""
         handler_repr = repr(handler)
-        handler_re = re.compile(r"<function (.*) at .*>")
-        match = handler_re.match(handler_repr)
+        match = _HANDLER_REPR_RE.match(handler_repr)
         if not match:
             raise ValueError(
                 f"cannot construct DeferredEvent from {handler}; please create one manually.",
@@ -115,6 +115,21 @@ def test_meta_autoload(tmp_path, legacy):
         ctx.run(ctx.on.start(), State())
 
 
+def test_meta_autoload_cached(tmp_path):
+    meta = {"type": "charm", "name": "foo", "summary": "foo", "description": "foo"}
+    with create_tempcharm(tmp_path, meta=dict(meta)) as charm:
+        spec = _CharmSpec.autoload(charm)
+        spec.meta["name"] = "bar"
+        # each spec gets its own copy of the parsed metadata
+        assert _CharmSpec.autoload(charm).meta["name"] == "foo"
+
+        # editing the file invalidates the cache
+        (tmp_path / "charmcraft.yaml").write_text(
+            yaml.safe_dump({**meta, "name": "josh"})
+        )
+        assert _CharmSpec.autoload(charm).meta["name"] == "josh"
+
+
 @pytest.mark.parametrize("legacy", (True, False))
 def test_no_meta_raises(tmp_path, legacy):
     with create_tempcharm(
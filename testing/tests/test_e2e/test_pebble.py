@@ -375,6 +375,29 @@ def test_exec_wait_output(charm_cls, command):
         assert ctx.exec_history[container.name][0].command == command
 
 
+def test_exec_wait_output_after_partial_read(charm_cls):
+    state = State(
+        containers={
+            Container(
+                name="foo",
+                can_connect=True,
+                execs={Exec(["foo"], stdout="hello pebble", stderr="oepsie")},
+            )
+        }
+    )
+
+    ctx = Context(charm_cls, meta={"name": "foo", "containers": {"foo": {}}})
+    with ctx(ctx.on.start(), state) as mgr:
+        container = mgr.charm.unit.get_container("foo")
+        proc = container.exec(["foo"])
+        assert proc.stdout.read(6) == "hello "
+        out, err = proc.wait_output()
+        assert out == "pebble"
+        assert err == "oepsie"
+        # Both outputs have now been read to the end.
+        assert proc.wait_output() == ("", "")
+
+
 def test_exec_wait_output_error(charm_cls):
     state = State(
         containers={
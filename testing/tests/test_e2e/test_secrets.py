@@ -114,6 +114,47 @@ def test_get_secret_owner_peek_update(mycharm, owner):
         )
 
 
+@pytest.mark.parametrize(
+    "juju_version, expected",
+    (
+        ("3.1.6", "c"),
+        ("3.1.7", "b"),
+        ("3.2.0", "c"),
+        ("3.3.1", "b"),
+        ("3.10.0", "b"),
+        ("4.0.0", "b"),
+    ),
+)
+def test_get_secret_owner_tracks_latest_on_old_juju(mycharm, juju_version, expected):
+    # Before Juju 3.3.1 (other than 3.1.7), secret owners always tracked the latest
+    # revision. Versions must be compared numerically, not as strings.
+    ctx = Context(mycharm, meta={"name": "local"}, juju_version=juju_version)
+    secret = Secret(
+        tracked_content={"a": "b"},
+        latest_content={"a": "c"},
+        owner="app",
+    )
+    with ctx(ctx.on.update_status(), State(leader=True, secrets={secret})) as mgr:
+        assert mgr.charm.model.get_secret(id=secret.id).get_content()["a"] == expected
+
+
+@pytest.mark.parametrize("juju_version", ("3.0.1", "2.9.46"))
+def test_get_secret_unsupported_juju(mycharm, juju_version):
+    ctx = Context(mycharm, meta={"name": "local"}, juju_version=juju_version)
+    secret = Secret({"a": "b"})
+    with ctx(ctx.on.update_status(), State(secrets={secret})) as mgr:
+        with pytest.raises(RuntimeError):
+            mgr.charm.model.get_secret(id=secret.id)
+
+
+@pytest.mark.parametrize("juju_version", ("3.0.2", "3.10.0", "10.0.0"))
+def test_get_secret_supported_juju(mycharm, juju_version):
+    ctx = Context(mycharm, meta={"name": "local"}, juju_version=juju_version)
+    secret = Secret({"a": "b"})
+    with ctx(ctx.on.update_status(), State(secrets={secret})) as mgr:
+        assert mgr.charm.model.get_secret(id=secret.id).get_content()["a"] == "b"
+
+
 @pytest.mark.parametrize("owner", ("app", "unit"))
 def test_secret_changed_owner_evt_fails(mycharm, owner):
     ctx = Context(mycharm, meta={"name": "local"})
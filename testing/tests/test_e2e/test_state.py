@@ -319,6 +319,27 @@ def test_deepcopy_state():
         assert container.name == copied_container.name
 
 
+def test_deepcopy_state_after_lookup():
+    relation = Relation("foo")
+    state = State(containers=[Container("foo")], relations=[relation])
+    # populate the lookup caches before copying.
+    assert state.get_container("foo").name == "foo"
+    assert state.get_relation(relation.id) is relation
+    state_copy = copy.deepcopy(state)
+    assert state_copy == state
+    assert state_copy.get_relation(relation.id).endpoint == "foo"
+
+
+def test_state_lookup_not_found():
+    state = State(containers=[Container("foo")])
+    with pytest.raises(KeyError):
+        state.get_container("bar")
+    with pytest.raises(KeyError):
+        state.get_network("bar")
+    with pytest.raises(KeyError):
+        state.get_relation(42)
+
+
 def test_replace_state():
     containers = [Container("foo"), Container("bar")]
     state = State(containers=containers, leader=True)
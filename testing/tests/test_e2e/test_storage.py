@@ -1,3 +1,5 @@
+import shutil
+
 import pytest
 from ops import CharmBase, ModelError
 
@@ -81,6 +83,20 @@ def test_storage_usage(storage_ctx):
     ).read_text() == "helloworlds"
 
 
+def test_storage_root_recreated(storage_ctx):
+    storage = Storage("foo")
+    state = State(storages={storage})
+    with storage_ctx(storage_ctx.on.update_status(), state) as mgr:
+        (mgr.charm.model.storages["foo"][0].location / "myfile.txt").write_text("a")
+
+    # the storage root is removed between runs on the same Context.
+    shutil.rmtree(storage.get_filesystem(storage_ctx))
+
+    with storage_ctx(storage_ctx.on.update_status(), state) as mgr:
+        (mgr.charm.model.storages["foo"][0].location / "myfile.txt").write_text("b")
+    assert (storage.get_filesystem(storage_ctx) / "myfile.txt").read_text() == "b"
+
+
 def test_storage_attached_event(storage_ctx):
     storage = Storage("foo")
     storage_ctx.run(storage_ctx.on.storage_attached(storage), State(storages={storage}))